@@ -8,87 +8,223 @@ from PyQt6.QtWidgets import (
     QMainWindow, QFileDialog, QMessageBox, QListWidgetItem,
     QInputDialog, QDialog, QVBoxLayout, QHBoxLayout, QLabel,
     QLineEdit, QPushButton, QTextEdit, QCheckBox, QComboBox,
-    QGroupBox, QFormLayout, QScrollArea, QWidget, QMenu
+    QGroupBox, QFormLayout, QScrollArea, QWidget, QMenu, QApplication
 )
-from PyQt6.QtCore import QThread, pyqtSignal, Qt
-from PyQt6.QtGui import QAction
+from PyQt6.QtCore import QThread, QTimer, pyqtSignal, Qt
+from PyQt6.QtGui import QAction, QTextCursor
 from PyQt6 import uic
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 import json
 import os
+import sys
 import difflib
+import queue
 import threading
-from typing import List, Dict, Any, Tuple
+from functools import lru_cache
+from typing import List, Dict, Any, Tuple, NamedTuple, Optional
 from datetime import datetime
-from utils import TemplateConverter, JSONValidator, ConfigManager, ThemeManager
+from urllib.parse import urlparse
+from utils import (TemplateConverter, JSONValidator, ConfigManager, ThemeManager, TemplateUtils,
+                   DockerComposeConverter, HTTPCache, YAML_HAS_LIBYAML)
+
+
+@lru_cache(maxsize=100_000)
+def _cached_ratio(text1: str, text2: str) -> float:
+    """Memoized SequenceMatcher ratio for already-lowercased strings"""
+    return difflib.SequenceMatcher(None, text1, text2).ratio()
+
+
+@lru_cache(maxsize=100_000)
+def _cached_quick_ratio(text1: str, text2: str) -> float:
+    """Memoized SequenceMatcher.quick_ratio() upper bound"""
+    return difflib.SequenceMatcher(None, text1, text2).quick_ratio()
+
+
+class TemplateFeatures(NamedTuple):
+    """Normalized template fields used for similarity scoring"""
+    title: str
+    image: str
+    description: str
+    stackfile: Optional[str]  # None when the template has no stackfile
+    env_names: Optional[frozenset]  # None when the template has no env vars
+
+
+_NO_ENV_NAMES = frozenset()
+
+
+def _lower(value: Any) -> str:
+    """Lowercase a template field, treating missing or non-string values as empty"""
+    return value.lower() if isinstance(value, str) else ''
+
+
+def _normalize_stackfile(stackfile: str) -> str:
+    """Drop blank lines, full-line comments and trailing whitespace from a stackfile"""
+    lines = (line.rstrip() for line in stackfile.splitlines())
+    return '\n'.join(line for line in lines if line and not line.lstrip().startswith('#'))
+
+
+def _fetch_in_background(fetch, urls: List[str], max_workers: int,
+                         stop: threading.Event) -> queue.SimpleQueue:
+    """Run fetch(url) on daemon threads and return a queue of (url, result, error) tuples
+
+    Daemon threads do not hold up interpreter exit, so a stalled download cannot keep
+    the process alive after the window closes. No further URLs are started once stop
+    is set.
+    """
+    pending = queue.SimpleQueue()
+    for url in urls:
+        pending.put(url)
+    results = queue.SimpleQueue()
+
+    def work():
+        while not stop.is_set():
+            try:
+                url = pending.get_nowait()
+            except queue.Empty:
+                return
+            try:
+                results.put((url, fetch(url), None))
+            except Exception as e:
+                results.put((url, None, e))
+
+    for _ in range(min(max_workers, len(urls))):
+        threading.Thread(target=work, daemon=True).start()
+    return results
 
 
 class TemplateComparator:
     """Handles comparison and similarity checking of templates"""
 
+    DUP_THRESHOLD = 0.7  # Templates at or above this similarity are duplicates
+    STACKFILE_COMPARE_LEN = 2048  # Leading characters of a stackfile that are compared
+
+    @staticmethod
+    def precompute(template: Dict) -> TemplateFeatures:
+        """Extract the normalized fields compared by calculate_similarity"""
+        stackfile = None
+        repo = template.get('repository')
+        if isinstance(repo, dict) and 'stackfile' in repo:
+            # Copies of one compose file that differ only in comments or
+            # whitespace then hit the identical-string fast path
+            stackfile = _normalize_stackfile(_lower(repo['stackfile']))
+            stackfile = stackfile[:TemplateComparator.STACKFILE_COMPARE_LEN]
+
+        env_names = None
+        env = template.get('env', [])
+        if env:
+            env_names = frozenset(var.get('name', '') for var in env if isinstance(var, dict))
+            if not env_names:
+                env_names = _NO_ENV_NAMES
+
+        return TemplateFeatures(
+            title=_lower(template.get('title')),
+            image=_lower(template.get('image')),
+            description=_lower(template.get('description')),
+            stackfile=stackfile,
+            env_names=env_names,
+        )
+
     @staticmethod
     def calculate_similarity(template1: Dict, template2: Dict) -> float:
         """Calculate similarity percentage between two templates"""
-        # Compare key fields in order of importance
-        title_sim = TemplateComparator._text_similarity(
-            template1.get('title', ''), template2.get('title', '')
+        return TemplateComparator.calculate_feature_similarity(
+            TemplateComparator.precompute(template1),
+            TemplateComparator.precompute(template2)
         )
 
-        image_sim = TemplateComparator._text_similarity(
-            template1.get('image', ''), template2.get('image', '')
+    @staticmethod
+    def calculate_feature_similarity(features1: TemplateFeatures,
+                                     features2: TemplateFeatures) -> float:
+        """Calculate similarity between two precomputed templates"""
+        # Bind class attributes once; this runs for every pair in a group
+        text_similarity = TemplateComparator._text_similarity
+        threshold = TemplateComparator.DUP_THRESHOLD
+
+        # Compare key fields in order of importance
+        title_sim = text_similarity(features1.title, features2.title)
+
+        # Each cutoff is the lowest field score that could still lift the
+        # total to the threshold if every later field matched perfectly
+        image_sim = text_similarity(
+            features1.image, features2.image,
+            cutoff=(threshold - title_sim * 0.3 - 0.45) / 0.25
         )
 
-        desc_sim = TemplateComparator._text_similarity(
-            template1.get('description', ''), template2.get('description', '')
+        # Description, compose and env weights add up to at most 0.45, so
+        # skip the expensive comparisons when they cannot reach the threshold
+        partial_sim = title_sim * 0.3 + image_sim * 0.25
+        if partial_sim + 0.45 < threshold:
+            return partial_sim
+
+        desc_sim = text_similarity(
+            features1.description, features2.description,
+            cutoff=(threshold - partial_sim - 0.25) / 0.2
         )
 
         # Compare compose file content if exists
         compose_sim = 0.0
-        if 'repository' in template1 and 'repository' in template2:
-            if 'stackfile' in template1['repository'] and 'stackfile' in template2['repository']:
-                compose_sim = TemplateComparator._text_similarity(
-                    template1['repository']['stackfile'],
-                    template2['repository']['stackfile']
-                )
+        if features1.stackfile is not None and features2.stackfile is not None:
+            compose_sim = text_similarity(
+                features1.stackfile, features2.stackfile,
+                cutoff=(threshold - partial_sim - desc_sim * 0.2 - 0.1) / 0.15
+            )
 
         # Compare environment variables
-        env_sim = TemplateComparator._compare_env_vars(
-            template1.get('env', []), template2.get('env', [])
-        )
+        env_sim = TemplateComparator._compare_env_vars(features1.env_names, features2.env_names)
 
         # Weighted average (title and image are most important)
-        total_sim = (title_sim * 0.3 + image_sim * 0.25 + desc_sim * 0.2 +
+        total_sim = (partial_sim + desc_sim * 0.2 +
                     compose_sim * 0.15 + env_sim * 0.1)
 
         return total_sim
 
     @staticmethod
-    def _text_similarity(text1: str, text2: str) -> float:
-        """Calculate text similarity using difflib"""
+    def _text_similarity(text1: str, text2: str, cutoff: float = 0.0) -> float:
+        """Calculate similarity of two lowercased strings using difflib
+
+        Returns 0.0 without running the full match when the cheap difflib
+        upper bounds already show the ratio is below cutoff.
+        """
         if not text1 and not text2:
             return 1.0
         if not text1 or not text2:
             return 0.0
 
-        return difflib.SequenceMatcher(None, text1.lower(), text2.lower()).ratio()
+        # Identical strings are the common case inside a title group
+        if text1 == text2:
+            return 1.0
+
+        if cutoff > 0.0:
+            # Same bound as SequenceMatcher.real_quick_ratio(), from lengths alone
+            shorter, longer = sorted((len(text1), len(text2)))
+            if 2.0 * shorter / (shorter + longer) < cutoff:
+                return 0.0
+            # quick_ratio() is symmetric, so order the pair to share one cache entry
+            if _cached_quick_ratio(*sorted((text1, text2))) < cutoff:
+                return 0.0
+
+        # ratio() depends on argument order, so it is cached as called
+        return _cached_ratio(text1, text2)
 
     @staticmethod
-    def _compare_env_vars(env1: List, env2: List) -> float:
-        """Compare environment variable lists"""
-        if not env1 and not env2:
+    def _compare_env_vars(env1_names: Optional[frozenset],
+                          env2_names: Optional[frozenset]) -> float:
+        """Compare environment variable name sets"""
+        if env1_names is None and env2_names is None:
             return 1.0
-        if not env1 or not env2:
+        if env1_names is None or env2_names is None:
             return 0.0
 
-        # Create sets of env var names for comparison
-        env1_names = {var.get('name', '') for var in env1 if isinstance(var, dict)}
-        env2_names = {var.get('name', '') for var in env2 if isinstance(var, dict)}
-
-        if not env1_names and not env2_names:
+        # Covers two empty sets as well as templates sharing the same variables
+        if env1_names is env2_names or env1_names == env2_names:
             return 1.0
 
-        intersection = len(env1_names.intersection(env2_names))
-        union = len(env1_names.union(env2_names))
+        # Set intersection already iterates the smaller set; derive the union
+        # size from it instead of building the union set
+        intersection = len(env1_names & env2_names)
+        union = len(env1_names) + len(env2_names) - intersection
 
         return intersection / union if union > 0 else 0.0
 
@@ -108,7 +244,7 @@ class TemplateComparator:
             return 'arm'
         elif 'amd64' in image or 'x86_64' in image:
             return 'amd64'
-        elif '386' in image or 'i386' in image:
+        elif '386' in image:  # also covers i386
             return '386'
 
         # Check in repository or other fields
@@ -127,23 +263,37 @@ class LoadTemplateWorker(QThread):
     """Worker thread for loading a template from URL"""
     finished = pyqtSignal(str, dict, str)  # url, data, error
 
-    def __init__(self, url: str):
+    def __init__(self, url: str, http_cache: HTTPCache):
         super().__init__()
         self.url = url
+        self.http_cache = http_cache
 
     def run(self):
         try:
-            response = requests.get(self.url, timeout=30)
-            response.raise_for_status()
-            data = response.json()
+            # Fetch on a daemon thread so neither close nor exit waits on a stalled download
+            results = _fetch_in_background(self.http_cache.fetch, [self.url], 1, threading.Event())
+            while True:
+                if self.isInterruptionRequested():
+                    return
+                try:
+                    _, content, error = results.get(timeout=0.1)
+                    break
+                except queue.Empty:
+                    pass
+            if error is not None:
+                raise error
+
+            data = json.loads(content)
 
             # Convert to Portainer format if needed
             try:
                 converted_data = TemplateConverter.convert_to_portainer(data)
-                self.finished.emit(self.url, converted_data, "")
             except ValueError as e:
                 # Store as-is if conversion fails
                 self.finished.emit(self.url, data, f"Format conversion warning: {str(e)}")
+            else:
+                TemplateUtils.intern_template_strings(converted_data.get('templates'))
+                self.finished.emit(self.url, converted_data, "")
         except Exception as e:
             self.finished.emit(self.url, {}, str(e))
 
@@ -154,59 +304,122 @@ class ProcessSourcesWorker(QThread):
     status = pyqtSignal(str)
     finished = pyqtSignal(dict)  # loaded_templates
 
-    def __init__(self, url_sources: List[str], file_sources: List[str], loaded_templates: Dict):
+    def __init__(self, url_sources: List[str], file_sources: List[str], loaded_templates: Dict,
+                 http_cache: HTTPCache):
         super().__init__()
         self.url_sources = url_sources
         self.file_sources = file_sources
         self.loaded_templates = loaded_templates.copy()
+        self.http_cache = http_cache
+        self.last_progress = -1
+
+    def emit_progress(self, percent: int):
+        """Emit progress only when the percentage actually changes"""
+        # Caps the signals queued to the GUI thread at 101 however many sources there are
+        if percent != self.last_progress:
+            self.last_progress = percent
+            self.progress.emit(percent)
+
+    @staticmethod
+    def fetch_url(http_cache: HTTPCache, url: str) -> Any:
+        """Download and parse JSON from a URL source"""
+        # Parse the raw bytes; json detects UTF-8/16/32 itself, which skips
+        # requests' text decoding and charset guessing on large catalogs
+        return json.loads(http_cache.fetch(url))
 
     def run(self):
         try:
             total_sources = len(self.url_sources) + len(self.file_sources)
             current = 0
 
-            # Process URL sources
-            for url in self.url_sources:
-                if url not in self.loaded_templates:
+            # Process URL sources, fetching them concurrently
+            urls_to_load = [url for url in self.url_sources if url not in self.loaded_templates]
+            current += len(self.url_sources) - len(urls_to_load)
+            if urls_to_load:
+                url_results = {}
+                for url in urls_to_load:
                     self.status.emit(f"Loading URL: {url}")
-                    try:
-                        response = requests.get(url, timeout=30)
-                        response.raise_for_status()
-                        data = response.json()
+                stop = threading.Event()
+                results = _fetch_in_background(
+                    lambda url: self.fetch_url(self.http_cache, url), urls_to_load, 16, stop
+                )
 
-                        # Convert to Portainer format if needed
+                # Poll with a timeout so a cancel is noticed even while every
+                # remaining download is stalled; those are then left behind
+                remaining = len(urls_to_load)
+                try:
+                    while remaining and not self.isInterruptionRequested():
                         try:
-                            converted_data = TemplateConverter.convert_to_portainer(data)
-                            self.loaded_templates[url] = converted_data
-                        except ValueError as e:
-                            self.status.emit(f"Format conversion error for {url}: {str(e)}")
-                            self.loaded_templates[url] = data
-                    except Exception as e:
-                        self.status.emit(f"Error loading {url}: {str(e)}")
+                            url, data, error = results.get(timeout=0.1)
+                        except queue.Empty:
+                            continue
+                        remaining -= 1
+
+                        if error is not None:
+                            self.status.emit(f"Error loading {url}: {str(error)}")
+                        else:
+                            url_results[url] = data
+
+                        current += 1
+                        self.emit_progress(int((current / total_sources) * 100))
+                finally:
+                    # Keep idle fetch threads from starting downloads nobody will read
+                    stop.set()
+
+                if self.isInterruptionRequested():
+                    self.status.emit("Source processing cancelled")
+                    return
+
+                # Store in source order so the combined output does not depend on
+                # which download finished first
+                for url in urls_to_load:
+                    if url not in url_results:
+                        continue
+                    data = url_results[url]
 
-                current += 1
-                self.progress.emit(int((current / total_sources) * 100))
+                    # Convert to Portainer format if needed
+                    try:
+                        converted_data = TemplateConverter.convert_to_portainer(data)
+                    except ValueError as e:
+                        self.status.emit(f"Format conversion error for {url}: {str(e)}")
+                        self.loaded_templates[url] = data
+                    else:
+                        self.loaded_templates[url] = converted_data
+                        TemplateUtils.intern_template_strings(converted_data.get('templates'))
+            elif self.url_sources:
+                self.emit_progress(int((current / total_sources) * 100))
 
             # Process file sources
             for file_path in self.file_sources:
+                if self.isInterruptionRequested():
+                    self.status.emit("Source processing cancelled")
+                    return
+
                 if file_path not in self.loaded_templates:
                     self.status.emit(f"Loading file: {os.path.basename(file_path)}")
                     try:
-                        with open(file_path, 'r', encoding='utf-8') as f:
-                            data = json.load(f)
+                        with open(file_path, 'rb') as f:
+                            if file_path.lower().endswith(('.yml', '.yaml')):
+                                if not YAML_HAS_LIBYAML:
+                                    self.status.emit("libyaml not available, using slower pure-Python YAML parser")
+                                data = DockerComposeConverter.load_yaml(f)
+                            else:
+                                data = json.loads(f.read())
 
                         # Convert to Portainer format if needed
                         try:
                             converted_data = TemplateConverter.convert_to_portainer(data)
-                            self.loaded_templates[file_path] = converted_data
                         except ValueError as e:
                             self.status.emit(f"Format conversion error for {file_path}: {str(e)}")
                             self.loaded_templates[file_path] = data
+                        else:
+                            self.loaded_templates[file_path] = converted_data
+                            TemplateUtils.intern_template_strings(converted_data.get('templates'))
                     except Exception as e:
                         self.status.emit(f"Error loading {file_path}: {str(e)}")
 
                 current += 1
-                self.progress.emit(int((current / total_sources) * 100))
+                self.emit_progress(int((current / total_sources) * 100))
 
             self.status.emit("All sources processed successfully")
             self.finished.emit(self.loaded_templates)
@@ -218,7 +431,9 @@ class ProcessSourcesWorker(QThread):
 class GenerateTemplateWorker(QThread):
     """Worker thread for generating the final template"""
     status = pyqtSignal(str)
-    finished = pyqtSignal(dict, int, int)  # final_template, original_count, final_count
+    # final_text is declared as object so the (possibly multi-MB) string is handed
+    # over as-is instead of being converted to a QString and back
+    finished = pyqtSignal(dict, int, int, object)  # final_template, original_count, final_count, final_text
 
     def __init__(self, loaded_templates: Dict, manual_templates: List, processor):
         super().__init__()
@@ -245,16 +460,10 @@ class GenerateTemplateWorker(QThread):
                     else:
                         continue
 
-                for template in templates:
-                    if isinstance(template, dict):
-                        # Add source info for tracking
-                        template['_source'] = source
-                        all_templates.append(template)
+                all_templates.extend(template for template in templates if isinstance(template, dict))
 
             # Add manual templates
-            for template in self.manual_templates:
-                template['_source'] = 'manual'
-                all_templates.append(template)
+            all_templates.extend(self.manual_templates)
 
             # Process templates for duplicates and architecture
             processed_templates = self.processor.process_duplicate_templates(all_templates)
@@ -265,16 +474,24 @@ class GenerateTemplateWorker(QThread):
                 "templates": processed_templates
             }
 
+            # Serialize once here so large catalogs do not block the GUI thread;
+            # the same text feeds both the preview and the saved file
+            final_text = json.dumps(final_template, indent=2, ensure_ascii=False)
+
             self.status.emit(f"Final template generated with {len(processed_templates)} templates")
-            self.finished.emit(final_template, len(all_templates), len(processed_templates))
+            self.finished.emit(final_template, len(all_templates), len(processed_templates), final_text)
         except Exception as e:
             self.status.emit(f"Error generating template: {str(e)}")
-            self.finished.emit({}, 0, 0)
+            self.finished.emit({}, 0, 0, "{}")
 
 
 class MainWindow(QMainWindow):
     """Main application window"""
 
+    PREVIEW_MAX_CHARS = 200_000
+    PREFIX_MATCH = Qt.MatchFlag.MatchStartsWith | Qt.MatchFlag.MatchCaseSensitive
+    WORKER_STOP_TIMEOUT_MS = 2000
+
     def __init__(self):
         super().__init__()
 
@@ -282,14 +499,34 @@ class MainWindow(QMainWindow):
         ui_path = os.path.join(os.path.dirname(__file__), 'config', 'main_window_pyqt6.ui')
         uic.loadUi(ui_path, self)
 
+        # Manual form widgets filled from the matching template keys
+        self.manual_text_fields = (
+            ('title', self.manualTitleLineEdit.setText),
+            ('description', self.manualDescriptionLineEdit.setText),
+            ('image', self.manualImageLineEdit.setText),
+            ('logo', self.manualLogoLineEdit.setText),
+            ('note', self.manualNoteTextEdit.setPlainText),
+        )
+        self.manual_combo_fields = (
+            ('platform', self.manualPlatformComboBox),
+            ('restart_policy', self.manualRestartComboBox),
+        )
+
         # Data storage
         self.url_sources = []
         self.file_sources = []
+        self.file_source_set = set()
+        self.source_display_names = {}
         self.loaded_templates = {}
+        self.base_template_key = None  # loaded_templates key of the base template
         self.manual_templates = []  # Store manually created templates
         self.all_categories = set()  # Store all unique categories from sources
+        self.categories_sources = []  # (source, data) pairs all_categories was built from
         self.all_templates_for_editing = []  # Store all templates for editing tab
+        self.edit_search_index = []  # Lowercased display text per edit list row
+        self.edit_row_sources = []  # Source display name per edit list row
         self.final_template = {"version": "2", "templates": []}
+        self.final_template_text = ""
         self.current_editing_context = None  # For tracking template edits
 
         # Worker threads
@@ -297,6 +534,39 @@ class MainWindow(QMainWindow):
         self.process_worker = None
         self.generate_worker = None
 
+        # Debounce edit list filtering so it runs once typing pauses
+        self.edit_filter_timer = QTimer(self)
+        self.edit_filter_timer.setSingleShot(True)
+        self.edit_filter_timer.setInterval(200)
+        self.edit_filter_timer.timeout.connect(self.apply_edit_filter)
+
+        # Coalesce bursts of status messages into one label repaint and log write
+        self.pending_status = ""
+        self.pending_log_lines = []
+        self.status_timer = QTimer(self)
+        self.status_timer.setSingleShot(True)
+        self.status_timer.setInterval(50)
+        self.status_timer.timeout.connect(self.flush_status)
+
+        # Write the config once after a burst of setting changes
+        self.config_save_timer = QTimer(self)
+        self.config_save_timer.setSingleShot(True)
+        self.config_save_timer.setInterval(500)
+        self.config_save_timer.timeout.connect(self.flush_config)
+
+        # Shared HTTP session so every fetch reuses pooled keep-alive connections
+        self.http = requests.Session()
+        http_retry = Retry(total=3, backoff_factor=0.3, status_forcelist=[502, 503, 504])
+        http_adapter = HTTPAdapter(pool_connections=8, pool_maxsize=16, max_retries=http_retry)
+        self.http.mount('https://', http_adapter)
+        self.http.mount('http://', http_adapter)
+        self.http.headers.update({
+            'User-Agent': 'JSON-Template-Combiner',
+            'Accept-Encoding': 'gzip, deflate',
+        })
+        # Unchanged URL sources are revalidated with a conditional GET instead of re-downloaded
+        self.http_cache = HTTPCache(self.http)
+
         # Configuration
         self.config = ConfigManager()
 
@@ -323,6 +593,24 @@ class MainWindow(QMainWindow):
         if self.base_template_enabled and self.base_template_auto_load:
             self.load_base_template()
 
+    def closeEvent(self, event):
+        """Stop workers, save pending settings and close connections before the window closes"""
+        if self.config_save_timer.isActive():
+            self.config_save_timer.stop()
+            self.flush_config()
+        self.flush_status()
+
+        if self.process_worker is not None and self.process_worker.isRunning():
+            self.process_worker.requestInterruption()
+            self.process_worker.wait(self.WORKER_STOP_TIMEOUT_MS)
+        if self.load_worker is not None and self.load_worker.isRunning():
+            self.load_worker.requestInterruption()
+            self.load_worker.wait(self.WORKER_STOP_TIMEOUT_MS)
+
+        # Release pooled keep-alive connections once no worker can use them
+        self.http.close()
+        super().closeEvent(event)
+
     def setup_connections(self):
         """Set up signal/slot connections"""
         # Sources tab
@@ -419,13 +707,12 @@ class MainWindow(QMainWindow):
         app = self.window().parent()
         if app is None:
             # Get QApplication instance
-            from PyQt6.QtWidgets import QApplication
             app = QApplication.instance()
 
         if self.theme_manager.apply_theme(app, theme_name):
             # Update config
             self.config.set('ui_settings.theme', theme_name)
-            self.config.save_config()
+            self.schedule_config_save()
 
             # Update menu checkmarks
             for name, action in self.theme_actions.items():
@@ -445,7 +732,7 @@ class MainWindow(QMainWindow):
             return
 
         self.update_status("Loading base template...")
-        self.load_worker = LoadTemplateWorker(self.base_template_url)
+        self.load_worker = LoadTemplateWorker(self.base_template_url, self.http_cache)
         self.load_worker.finished.connect(self.on_base_template_loaded)
         self.load_worker.start()
 
@@ -454,8 +741,11 @@ class MainWindow(QMainWindow):
         if error:
             self.update_status(f"Error loading base template: {error}")
         else:
-            # Store with special key to distinguish from URL sources
-            self.loaded_templates[f"BASE_TEMPLATE:{url}"] = data
+            # Store with special key to distinguish from URL sources,
+            # replacing any base template loaded from a previous URL
+            self.clear_base_template_data()
+            self.base_template_key = f"BASE_TEMPLATE:{url}"
+            self.loaded_templates[self.base_template_key] = data
             self.update_status("Base template loaded successfully")
 
     def add_url_source(self):
@@ -470,7 +760,6 @@ class MainWindow(QMainWindow):
             return
 
         # Validate URL
-        from urllib.parse import urlparse
         try:
             result = urlparse(url)
             if not all([result.scheme, result.netloc]):
@@ -496,6 +785,7 @@ class MainWindow(QMainWindow):
 
         # Remove from sources and UI
         del self.url_sources[row]
+        self.source_display_names.pop(url, None)
         self.urlListWidget.takeItem(row)
 
         # Remove from loaded templates if exists
@@ -516,11 +806,12 @@ class MainWindow(QMainWindow):
         if not file_path:
             return
 
-        if file_path in self.file_sources:
+        if file_path in self.file_source_set:
             QMessageBox.warning(self, "Warning", "File already added")
             return
 
         self.file_sources.append(file_path)
+        self.file_source_set.add(file_path)
         self.fileListWidget.addItem(os.path.basename(file_path))
         self.update_status(f"Added file source: {os.path.basename(file_path)}")
 
@@ -535,6 +826,8 @@ class MainWindow(QMainWindow):
         file_path = self.file_sources[row]
 
         del self.file_sources[row]
+        self.file_source_set.discard(file_path)
+        self.source_display_names.pop(file_path, None)
         self.fileListWidget.takeItem(row)
 
         # Remove from loaded templates if exists
@@ -547,7 +840,7 @@ class MainWindow(QMainWindow):
         """Toggle base template enabled/disabled"""
         self.base_template_enabled = checked
         self.config.set('base_template.enabled', checked)
-        self.config.save_config()
+        self.schedule_config_save()
         self.update_status(f"Base template {'enabled' if checked else 'disabled'}")
 
     def update_base_template_url(self):
@@ -559,27 +852,27 @@ class MainWindow(QMainWindow):
 
         self.base_template_url = new_url
         self.config.set('base_template.url', new_url)
-        self.config.save_config()
+        self.schedule_config_save()
 
         # Reload if enabled
         if self.base_template_enabled:
             # Clear old base template
-            keys_to_remove = [k for k in self.loaded_templates.keys() if k.startswith("BASE_TEMPLATE:")]
-            for key in keys_to_remove:
-                del self.loaded_templates[key]
+            self.clear_base_template_data()
 
             # Load new one
             self.load_base_template()
 
     def clear_base_template(self):
         """Clear the base template"""
-        # Remove from loaded templates
-        keys_to_remove = [k for k in self.loaded_templates.keys() if k.startswith("BASE_TEMPLATE:")]
-        for key in keys_to_remove:
-            del self.loaded_templates[key]
-
+        self.clear_base_template_data()
         self.update_status("Base template cleared")
 
+    def clear_base_template_data(self):
+        """Remove the loaded base template, if any, from loaded templates"""
+        if self.base_template_key is not None:
+            self.loaded_templates.pop(self.base_template_key, None)
+            self.base_template_key = None
+
     def process_sources(self):
         """Process all sources and load JSON data"""
         if not self.url_sources and not self.file_sources:
@@ -587,7 +880,7 @@ class MainWindow(QMainWindow):
             return
 
         self.process_worker = ProcessSourcesWorker(
-            self.url_sources, self.file_sources, self.loaded_templates
+            self.url_sources, self.file_sources, self.loaded_templates, self.http_cache
         )
         self.process_worker.progress.connect(self.progressBar.setValue)
         self.process_worker.status.connect(self.update_status)
@@ -596,7 +889,17 @@ class MainWindow(QMainWindow):
 
     def on_sources_processed(self, loaded_templates: dict):
         """Handle sources processed"""
-        self.loaded_templates = loaded_templates
+        # The worker started from a copy, so it may carry a base template replaced since then
+        base_data = self.loaded_templates.get(self.base_template_key)
+        templates = {}
+        if base_data is not None and self.base_template_key not in loaded_templates:
+            templates[self.base_template_key] = base_data
+        for key, value in loaded_templates.items():
+            if key == self.base_template_key:
+                templates[key] = base_data
+            elif not key.startswith("BASE_TEMPLATE:"):
+                templates[key] = value
+        self.loaded_templates = templates
         self.generate_summary()
 
         # Refresh categories and edit templates list
@@ -609,7 +912,7 @@ class MainWindow(QMainWindow):
         total_templates = 0
 
         for source, data in self.loaded_templates.items():
-            source_name = os.path.basename(source) if os.path.exists(source) else source
+            source_name = os.path.basename(source) if source in self.file_source_set else source
 
             if isinstance(data, dict):
                 if 'templates' in data and isinstance(data['templates'], list):
@@ -659,10 +962,9 @@ class MainWindow(QMainWindow):
             return
 
         # Check if already in list
-        for i in range(self.categoriesListWidget.count()):
-            if self.categoriesListWidget.item(i).text() == category:
-                QMessageBox.warning(self, "Duplicate Category", f"Category '{category}' is already added")
-                return
+        if self.categoriesListWidget.findItems(category, Qt.MatchFlag.MatchExactly):
+            QMessageBox.warning(self, "Duplicate Category", f"Category '{category}' is already added")
+            return
 
         self.categoriesListWidget.addItem(category)
         self.manualCategoryComboBox.setCurrentIndex(0)  # Reset to "Select..."
@@ -705,16 +1007,25 @@ class MainWindow(QMainWindow):
         """Refresh categories from loaded templates"""
         self.extract_categories_from_templates()
         # Update combo box
-        categories_list = ["Select..."] + sorted(list(self.all_categories))
+        categories_list = ["Select..."] + sorted(self.all_categories)
         self.manualCategoryComboBox.clear()
         self.manualCategoryComboBox.addItems(categories_list)
         self.update_status("Categories refreshed")
 
     def extract_categories_from_templates(self):
         """Extract all unique categories from loaded templates"""
+        # Loaded data is replaced rather than mutated, so if every source still
+        # maps to the same object the categories cannot have changed
+        sources = list(self.loaded_templates.items())
+        if len(sources) == len(self.categories_sources) and all(
+                source == cached_source and data is cached_data
+                for (source, data), (cached_source, cached_data) in zip(sources, self.categories_sources)):
+            return
+
+        self.categories_sources = sources
         self.all_categories = set()
-        
-        for source, data in self.loaded_templates.items():
+
+        for source, data in sources:
             try:
                 templates = JSONValidator.extract_templates(data)
                 for template in templates:
@@ -738,13 +1049,11 @@ class MainWindow(QMainWindow):
             return
 
         # Check for duplicates
-        for i in range(self.envListWidget.count()):
-            existing = self.envListWidget.item(i).text()
-            existing_name = existing.split('=')[0] if '=' in existing else existing
-            if existing_name == name:
-                QMessageBox.warning(self, "Duplicate Variable", 
-                                  f"Environment variable '{name}' already exists")
-                return
+        if (self.envListWidget.findItems(name, Qt.MatchFlag.MatchExactly) or
+                self.envListWidget.findItems(f"{name}=", self.PREFIX_MATCH)):
+            QMessageBox.warning(self, "Duplicate Variable", 
+                              f"Environment variable '{name}' already exists")
+            return
 
         display_text = f"{name}={value}" if value else name
         self.envListWidget.addItem(display_text)
@@ -810,11 +1119,9 @@ class MainWindow(QMainWindow):
             return
 
         # Check for duplicates
-        for i in range(self.portsListWidget.count()):
-            existing = self.portsListWidget.item(i).text()
-            if existing.startswith(f"{label}: "):
-                QMessageBox.warning(self, "Duplicate Port", f"Port label '{label}' already exists")
-                return
+        if self.portsListWidget.findItems(f"{label}: ", self.PREFIX_MATCH):
+            QMessageBox.warning(self, "Duplicate Port", f"Port label '{label}' already exists")
+            return
 
         display_text = f"{label}: {port}"
         self.portsListWidget.addItem(display_text)
@@ -876,12 +1183,10 @@ class MainWindow(QMainWindow):
             return
 
         # Check for duplicates
-        for i in range(self.volumesListWidget.count()):
-            existing = self.volumesListWidget.item(i).text()
-            if existing.startswith(f"{container_path} -> "):
-                QMessageBox.warning(self, "Duplicate Volume", 
-                                  f"Container path '{container_path}' already exists")
-                return
+        if self.volumesListWidget.findItems(f"{container_path} -> ", self.PREFIX_MATCH):
+            QMessageBox.warning(self, "Duplicate Volume", 
+                              f"Container path '{container_path}' already exists")
+            return
 
         display_text = f"{container_path} -> {bind_path}"
         self.volumesListWidget.addItem(display_text)
@@ -1003,16 +1308,13 @@ class MainWindow(QMainWindow):
             template['administrator_only'] = True
 
         # Categories
-        categories = []
-        for i in range(self.categoriesListWidget.count()):
-            categories.append(self.categoriesListWidget.item(i).text())
+        categories = self.list_widget_texts(self.categoriesListWidget)
         if categories:
             template['categories'] = categories
 
         # Environment variables
         env_vars = []
-        for i in range(self.envListWidget.count()):
-            env_text = self.envListWidget.item(i).text()
+        for env_text in self.list_widget_texts(self.envListWidget):
             if '=' in env_text:
                 name, value = env_text.split('=', 1)
                 env_vars.append({"name": name, "default": value})
@@ -1023,8 +1325,7 @@ class MainWindow(QMainWindow):
 
         # Ports
         ports = []
-        for i in range(self.portsListWidget.count()):
-            port_text = self.portsListWidget.item(i).text()
+        for port_text in self.list_widget_texts(self.portsListWidget):
             if ': ' in port_text:
                 label, port = port_text.split(': ', 1)
                 ports.append(f"{port}/{label}")
@@ -1033,8 +1334,7 @@ class MainWindow(QMainWindow):
 
         # Volumes
         volumes = []
-        for i in range(self.volumesListWidget.count()):
-            volume_text = self.volumesListWidget.item(i).text()
+        for volume_text in self.list_widget_texts(self.volumesListWidget):
             if ' -> ' in volume_text:
                 container, bind = volume_text.split(' -> ', 1)
                 volumes.append({"container": container, "bind": bind})
@@ -1053,25 +1353,24 @@ class MainWindow(QMainWindow):
         # Add to manual templates
         self.manual_templates.append(template)
 
-        self.update_status(f"Manual template '{template['title']}' added successfully")
-
-        # Clear form
+        # Clear form first; it reports its own status, which would replace the confirmation
         self.clear_manual_form()
 
-        # Show confirmation
-        QMessageBox.information(self, "Success", 
-                               f"Template '{template['title']}' added successfully!\n\n"
-                               f"You can now generate the final template in the Preview tab.")
+        self.update_status(f"Manual template '{template['title']}' added successfully")
 
     # ========== EDIT TEMPLATES TAB METHODS ==========
 
     def refresh_edit_templates_list(self):
         """Refresh the list of templates available for editing"""
         self.all_templates_for_editing = []
+        self.edit_search_index = []
+        self.edit_row_sources = []
         self.editTemplatesListWidget.clear()
+        display_texts = []
 
         # Collect all templates with their source
         for source, data in self.loaded_templates.items():
+            source_name = self.get_source_display_name(source)
             try:
                 templates = JSONValidator.extract_templates(data)
                 for template in templates:
@@ -1082,13 +1381,17 @@ class MainWindow(QMainWindow):
                         }
                         self.all_templates_for_editing.append(template_info)
 
-                        # Add to list widget
-                        source_name = self.get_source_display_name(source)
+                        # Queue row for the list widget
                         display_text = f"{template['title']} - {template.get('image', 'N/A')} [{source_name}]"
-                        self.editTemplatesListWidget.addItem(display_text)
+                        display_texts.append(display_text)
+                        self.edit_search_index.append(display_text.lower())
+                        self.edit_row_sources.append(source_name)
             except:
                 pass
 
+        # Insert all rows in one call instead of one addItem per template
+        self.editTemplatesListWidget.addItems(display_texts)
+
         # Update source filter combo
         sources = ["All Sources"] + [self.get_source_display_name(s) for s in self.loaded_templates.keys()]
         self.sourceFilterComboBox.clear()
@@ -1098,41 +1401,46 @@ class MainWindow(QMainWindow):
 
     def get_source_display_name(self, source: str) -> str:
         """Get a friendly display name for a source"""
+        name = self.source_display_names.get(source)
+        if name is not None:
+            return name
+
         if source.startswith("BASE_TEMPLATE:"):
-            return "Base Template"
-        elif os.path.exists(source):
-            return os.path.basename(source)
-        else:
+            name = "Base Template"
+        elif source in self.file_source_set:
+            name = os.path.basename(source)
+        elif len(source) > 50:
             # Shorten long URLs
-            if len(source) > 50:
-                return source[:47] + "..."
-            return source
+            name = source[:47] + "..."
+        else:
+            name = source
 
-    def filter_edit_templates(self, text: str = ""):
-        """Filter templates by search text"""
-        search_text = self.editFilterLineEdit.text().lower()
+        self.source_display_names[source] = name
+        return name
 
-        for i in range(self.editTemplatesListWidget.count()):
-            item = self.editTemplatesListWidget.item(i)
-            if search_text in item.text().lower():
-                item.setHidden(False)
-            else:
-                item.setHidden(True)
+    def filter_edit_templates(self, text: str = ""):
+        """Schedule filtering of templates by search text"""
+        # Restarting the timer collapses a burst of keystrokes into one pass
+        self.edit_filter_timer.start()
+
+    def apply_edit_filter(self):
+        """Filter templates by search text and source"""
+        # Every whitespace-separated term must appear, in any order, so
+        # "nginx proxy" matches "Nginx Proxy Manager" as well as "proxy - nginx"
+        terms = self.editFilterLineEdit.text().lower().split()
+        source_name = self.sourceFilterComboBox.currentText()
+        any_source = source_name in ("", "All Sources")
+
+        # Both filters are applied in one pass so neither undoes the other
+        item = self.editTemplatesListWidget.item
+        for i, (haystack, row_source) in enumerate(zip(self.edit_search_index, self.edit_row_sources)):
+            matches = all(term in haystack for term in terms)
+            item(i).setHidden(not matches or not (any_source or row_source == source_name))
 
     def filter_by_source(self, source_name: str):
         """Filter templates by source"""
-        if source_name == "All Sources":
-            # Show all
-            for i in range(self.editTemplatesListWidget.count()):
-                self.editTemplatesListWidget.item(i).setHidden(False)
-        else:
-            # Filter by source
-            for i in range(self.editTemplatesListWidget.count()):
-                item = self.editTemplatesListWidget.item(i)
-                if f"[{source_name}]" in item.text():
-                    item.setHidden(False)
-                else:
-                    item.setHidden(True)
+        self.edit_filter_timer.stop()
+        self.apply_edit_filter()
 
     def edit_selected_template(self, item=None):
         """Edit the selected template"""
@@ -1169,8 +1477,7 @@ class MainWindow(QMainWindow):
         # Add to manual templates
         self.manual_templates.append(template)
 
-        QMessageBox.information(self, "Success", 
-                               f"Template '{template['title']}' cloned successfully!")
+        self.update_status(f"Template '{template['title']}' cloned successfully")
 
     def view_template_json(self):
         """View the JSON of the selected template"""
@@ -1213,9 +1520,8 @@ class MainWindow(QMainWindow):
         # Switch to manual entry tab
         self.tabWidget.setCurrentIndex(1)
 
-        QMessageBox.information(self, "Edit Mode", 
-                               "Template loaded into Manual Entry tab.\n\n"
-                               "Make your changes and click 'Add Template' to save as a new template.")
+        self.update_status("Template loaded into Manual Entry tab. "
+                           "Make your changes and click 'Add Template' to save as a new template.")
 
     def populate_manual_form_with_template(self, template: Dict):
         """Populate the manual entry form with template data"""
@@ -1223,60 +1529,52 @@ class MainWindow(QMainWindow):
         self.clear_manual_form()
 
         # Basic fields
-        if 'title' in template:
-            self.manualTitleLineEdit.setText(template['title'])
-        if 'description' in template:
-            self.manualDescriptionLineEdit.setText(template['description'])
-        if 'image' in template:
-            self.manualImageLineEdit.setText(template['image'])
-        if 'logo' in template:
-            self.manualLogoLineEdit.setText(template['logo'])
-        if 'note' in template:
-            self.manualNoteTextEdit.setPlainText(template['note'])
+        for key, set_text in self.manual_text_fields:
+            if key in template:
+                set_text(template[key])
 
         # Platform and restart
-        if 'platform' in template:
-            index = self.manualPlatformComboBox.findText(template['platform'])
-            if index >= 0:
-                self.manualPlatformComboBox.setCurrentIndex(index)
-
-        if 'restart_policy' in template:
-            index = self.manualRestartComboBox.findText(template['restart_policy'])
-            if index >= 0:
-                self.manualRestartComboBox.setCurrentIndex(index)
+        for key, combo in self.manual_combo_fields:
+            if key in template:
+                index = combo.findText(template[key])
+                if index >= 0:
+                    combo.setCurrentIndex(index)
 
         # Admin only
         if template.get('administrator_only', False):
             self.manualAdminOnlyCheckBox.setChecked(True)
 
+        # Each list is filled with a single addItems call rather than one addItem per entry
+
         # Categories
         if 'categories' in template and isinstance(template['categories'], list):
-            for category in template['categories']:
-                self.categoriesListWidget.addItem(category)
+            self.categoriesListWidget.addItems(template['categories'])
 
         # Environment variables
         if 'env' in template and isinstance(template['env'], list):
+            env_items = []
             for env_var in template['env']:
                 if isinstance(env_var, dict):
                     name = env_var.get('name', '')
                     default = env_var.get('default', '')
-                    display_text = f"{name}={default}" if default else name
-                    self.envListWidget.addItem(display_text)
+                    env_items.append(f"{name}={default}" if default else name)
+            self.envListWidget.addItems(env_items)
 
         # Ports
         if 'ports' in template and isinstance(template['ports'], list):
-            for port in template['ports']:
-                # Port format varies, handle both "80/tcp" and more complex formats
-                self.portsListWidget.addItem(str(port))
+            # Port format varies, handle both "80/tcp" and more complex formats
+            self.portsListWidget.addItems([str(port) for port in template['ports']])
 
         # Volumes
         if 'volumes' in template and isinstance(template['volumes'], list):
+            volume_items = []
             for volume in template['volumes']:
                 if isinstance(volume, dict):
                     container = volume.get('container', '')
                     bind = volume.get('bind', '')
                     if container and bind:
-                        self.volumesListWidget.addItem(f"{container} -> {bind}")
+                        volume_items.append(f"{container} -> {bind}")
+            self.volumesListWidget.addItems(volume_items)
 
     # ========== PREVIEW AND SAVE TAB METHODS ==========
 
@@ -1289,26 +1587,35 @@ class MainWindow(QMainWindow):
         self.generate_worker.finished.connect(self.on_template_generated)
         self.generate_worker.start()
 
-    def on_template_generated(self, final_template: dict, original_count: int, final_count: int):
+    def on_template_generated(self, final_template: dict, original_count: int, final_count: int,
+                              final_text: str):
         """Handle template generated"""
         self.final_template = final_template
+        self.final_template_text = final_text
 
-        # Update preview
-        self.previewTextEdit.setPlainText(json.dumps(self.final_template, indent=2))
+        # Update preview; laying out megabytes of text in the widget is slow,
+        # so only the head of very large catalogs is shown
+        if len(final_text) > self.PREVIEW_MAX_CHARS:
+            preview_text = (final_text[:self.PREVIEW_MAX_CHARS] +
+                            f"\n\n... (preview truncated, {final_count} templates)")
+        else:
+            preview_text = final_text
+        self.previewTextEdit.setPlainText(preview_text)
 
         # Update summary with deduplication info
         self.update_summary_with_dedup_info(original_count, final_count)
 
     def update_summary_with_dedup_info(self, original_count: int, final_count: int):
         """Update summary with deduplication information"""
-        current_text = self.summaryTextEdit.toPlainText()
-
         dedup_info = f"\n--- Processing Complete ---\n"
         dedup_info += f"Original templates: {original_count}\n"
         dedup_info += f"Final templates: {final_count}\n"
         dedup_info += f"Duplicates removed: {original_count - final_count}\n"
 
-        self.summaryTextEdit.setPlainText(current_text + dedup_info)
+        # Append at the end instead of reading back and replacing the whole summary
+        cursor = self.summaryTextEdit.textCursor()
+        cursor.movePosition(QTextCursor.MoveOperation.End)
+        cursor.insertText(dedup_info)
 
     def browse_save_location(self):
         """Browse for save location"""
@@ -1338,18 +1645,12 @@ class MainWindow(QMainWindow):
             # Ensure directory exists
             os.makedirs(os.path.dirname(os.path.abspath(save_path)), exist_ok=True)
 
-            # Save the file
+            # Reuse the text serialized by the generate worker
             with open(save_path, 'w', encoding='utf-8') as f:
-                json.dump(self.final_template, f, indent=2, ensure_ascii=False)
+                f.write(self.final_template_text)
 
             self.saveStatusLabel.setText(f"✓ Template saved successfully to: {save_path}")
-            QMessageBox.information(
-                self,
-                "Success",
-                f"Template saved successfully!\n\n"
-                f"Location: {save_path}\n"
-                f"Templates: {len(self.final_template['templates'])}"
-            )
+            self.update_status(f"Saved {len(self.final_template['templates'])} templates to {save_path}")
         except Exception as e:
             error_msg = f"Error saving template: {str(e)}"
             self.saveStatusLabel.setText(f"✗ {error_msg}")
@@ -1362,18 +1663,18 @@ class MainWindow(QMainWindow):
         processed = []
         template_groups = {}
 
-        # Group templates by name/title
+        # Group templates by name/title, ignoring case so "Jellyfin" and
+        # "jellyfin" are checked against each other
         for template in templates:
-            title = template.get('title', '').strip()
+            title = (template.get('title') or '').strip()
             if not title:
                 continue
 
-            if title not in template_groups:
-                template_groups[title] = []
-            template_groups[title].append(template)
+            template_groups.setdefault(title.casefold(), []).append(template)
 
         # Process each group
-        for title, group in template_groups.items():
+        for group in template_groups.values():
+            title = group[0]['title'].strip()
             if len(group) == 1:
                 # Single template, just clean and add
                 clean_template = self.clean_template(group[0])
@@ -1392,17 +1693,25 @@ class MainWindow(QMainWindow):
         unique_templates = []
         architecture_variants = {}
 
+        group = self.drop_identical_templates(group)
+        # Normalize each template once instead of on every pairwise comparison
+        features = {id(template): TemplateComparator.precompute(template) for template in group}
+        archs = {id(template): TemplateComparator.detect_architecture(template) for template in group}
+        scores = {}
+
         for template in group:
             is_duplicate = False
-            arch = TemplateComparator.detect_architecture(template)
+            arch = archs[id(template)]
 
             # Check similarity with existing unique templates
-            for existing in unique_templates:
-                similarity = TemplateComparator.calculate_similarity(template, existing)
+            for position, existing in enumerate(unique_templates):
+                similarity = TemplateComparator.calculate_feature_similarity(
+                    features[id(template)], features[id(existing)]
+                )
 
-                if similarity >= 0.7:  # 70% similarity threshold
+                if similarity >= TemplateComparator.DUP_THRESHOLD:
                     is_duplicate = True
-                    existing_arch = TemplateComparator.detect_architecture(existing)
+                    existing_arch = archs[id(existing)]
 
                     # If architectures are different, keep both with architecture suffix
                     if arch != existing_arch:
@@ -1412,9 +1721,9 @@ class MainWindow(QMainWindow):
                             architecture_variants[existing_arch] = existing
                     else:
                         # Same architecture, pick the best one
-                        if self.is_better_template(template, existing):
+                        if self.is_better_template(template, existing, scores):
                             # Replace existing with current
-                            unique_templates[unique_templates.index(existing)] = template
+                            unique_templates[position] = template
                     break
 
             if not is_duplicate:
@@ -1423,14 +1732,11 @@ class MainWindow(QMainWindow):
         # Handle architecture variants
         if architecture_variants:
             for arch, template in architecture_variants.items():
-                clean_template = self.clean_template(template)
-                clean_template['title'] = f"{title}-{arch}"
-                result.append(clean_template)
+                result.append({**self.clean_template(template), 'title': f"{title}-{arch}"})
 
             # Remove any templates that became architecture variants from unique_templates
-            for template in architecture_variants.values():
-                if template in unique_templates:
-                    unique_templates.remove(template)
+            variant_ids = {id(template) for template in architecture_variants.values()}
+            unique_templates = [template for template in unique_templates if id(template) not in variant_ids]
 
         # Add remaining unique templates
         for template in unique_templates:
@@ -1439,11 +1745,39 @@ class MainWindow(QMainWindow):
 
         return result
 
-    def is_better_template(self, template1: Dict, template2: Dict) -> bool:
+    def drop_identical_templates(self, group: List[Dict]) -> List[Dict]:
+        """Keep only the first of any templates with identical content"""
+        seen = set()
+        distinct = []
+
+        for template in group:
+            # Mirrored sources often ship byte-identical templates; those would
+            # score 1.0 against each other, so skip the pairwise comparison
+            try:
+                key = json.dumps({k: v for k, v in template.items() if k != '_source'},
+                                 sort_keys=True, default=str)
+            except (TypeError, ValueError):
+                # Mixed key types (e.g. from YAML sources) cannot be sorted, and
+                # recursive values cannot be serialized; treat these as distinct
+                distinct.append(template)
+                continue
+
+            if key not in seen:
+                seen.add(key)
+                distinct.append(template)
+
+        return distinct
+
+    def is_better_template(self, template1: Dict, template2: Dict,
+                           scores: Optional[Dict[int, int]] = None) -> bool:
         """Determine which template is better based on completeness and quality"""
-        score1 = self.calculate_template_score(template1)
-        score2 = self.calculate_template_score(template2)
-        return score1 > score2
+        if scores is None:
+            scores = {}
+        # Scores are cached by id() so a template is only scored once per group
+        for template in (template1, template2):
+            if id(template) not in scores:
+                scores[id(template)] = self.calculate_template_score(template)
+        return scores[id(template1)] > scores[id(template2)]
 
     def calculate_template_score(self, template: Dict) -> int:
         """Calculate a quality score for a template"""
@@ -1476,17 +1810,44 @@ class MainWindow(QMainWindow):
 
     def clean_template(self, template: Dict) -> Dict:
         """Clean template by removing internal fields"""
-        clean = template.copy()
-
-        # Remove internal tracking fields
-        if '_source' in clean:
-            del clean['_source']
+        # Templates are no longer tagged, but ones saved by older versions may
+        # still carry the field; only those need a copy
+        if '_source' not in template:
+            return template
 
+        clean = template.copy()
+        del clean['_source']
         return clean
 
     # ========== UTILITY METHODS ==========
 
+    @staticmethod
+    def list_widget_texts(list_widget) -> List[str]:
+        """Return the text of every item in a list widget"""
+        item = list_widget.item
+        return [item(i).text() for i in range(list_widget.count())]
+
     def update_status(self, message: str):
         """Update status label"""
-        self.statusLabel.setText(message)
-        print(f"[{datetime.now().strftime('%H:%M:%S')}] {message}")
+        self.pending_status = message
+        self.pending_log_lines.append(f"[{datetime.now().strftime('%H:%M:%S')}] {message}\n")
+        if not self.status_timer.isActive():
+            self.status_timer.start()
+
+    def schedule_config_save(self):
+        """Save the configuration shortly, once further changes have settled"""
+        self.config_save_timer.start()
+
+    def flush_config(self):
+        """Write the configuration to disk"""
+        self.config.save_config()
+
+    def flush_status(self):
+        """Show the most recent status message and write buffered log lines"""
+        self.statusLabel.setText(self.pending_status)
+
+        # stdout is None when started through pythonw
+        if self.pending_log_lines and sys.stdout is not None:
+            sys.stdout.write(''.join(self.pending_log_lines))
+            sys.stdout.flush()
+        self.pending_log_lines.clear()
@@ -2,13 +2,23 @@
 Utility functions for JSON Template Combiner
 """
 
+import hashlib
 import json
 import os
+import sys
+import tempfile
 import requests
-from typing import Dict, Any, Optional, List
+from typing import Dict, Any, Optional, List, Tuple
 from urllib.parse import urlparse
 import yaml
 
+try:
+    from yaml import CSafeLoader as YamlLoader
+except ImportError:
+    from yaml import SafeLoader as YamlLoader
+
+YAML_HAS_LIBYAML = YamlLoader.__name__ == 'CSafeLoader'
+
 
 class ConfigManager:
     """Manages application configuration"""
@@ -41,8 +51,11 @@ class ConfigManager:
             if config_dir and not os.path.exists(config_dir):
                 os.makedirs(config_dir, exist_ok=True)
             
-            with open(self.config_file, 'w', encoding='utf-8') as f:
-                json.dump(self.config, f, indent=2, ensure_ascii=False)
+            # Write to a temporary file and rename so a crash never leaves a truncated config
+            temp_file = f"{self.config_file}.tmp"
+            with open(temp_file, 'w', encoding='utf-8') as f:
+                f.write(json.dumps(self.config, indent=2, ensure_ascii=False))
+            os.replace(temp_file, self.config_file)
             return True
         except Exception as e:
             print(f"Error saving config: {e}")
@@ -226,8 +239,8 @@ class DockerComposeConverter:
             return False
         
         try:
-            with open(file_path, 'r', encoding='utf-8') as f:
-                content = yaml.safe_load(f)
+            with open(file_path, 'rb') as f:
+                content = DockerComposeConverter.load_yaml(f)
                 
             # Check for Docker Compose indicators
             if isinstance(content, dict):
@@ -242,6 +255,11 @@ class DockerComposeConverter:
         
         return False
     
+    @staticmethod
+    def load_yaml(stream) -> Any:
+        """Parse YAML using the libyaml-backed loader when available"""
+        return yaml.load(stream, Loader=YamlLoader)
+
     @staticmethod
     def is_docker_compose_data(data: Any) -> bool:
         """Check if data structure looks like Docker Compose"""
@@ -565,6 +583,65 @@ class NetworkUtils:
             raise Exception(f"Unexpected error: {str(e)}")
 
 
+class HTTPCache:
+    """Keeps URL response bodies on disk and revalidates them with conditional GETs"""
+
+    def __init__(self, session: requests.Session, cache_dir: Optional[str] = None):
+        self.session = session
+        self.cache_dir = cache_dir or os.path.join(os.path.expanduser('~'), '.cache', 'json-template-combiner')
+
+    def _paths(self, url: str) -> Tuple[str, str]:
+        """Get the metadata and body file paths for a URL"""
+        base = os.path.join(self.cache_dir, hashlib.sha256(url.encode('utf-8')).hexdigest())
+        return f"{base}.meta.json", f"{base}.body"
+
+    def fetch(self, url: str, timeout: Tuple[float, float] = (5, 30)) -> bytes:
+        """Fetch the body of a URL, reusing the cached copy when the server reports it unchanged"""
+        meta_path, body_path = self._paths(url)
+
+        headers = {}
+        try:
+            with open(meta_path, 'r', encoding='utf-8') as f:
+                meta = json.load(f)
+            if os.path.exists(body_path):
+                if meta.get('etag'):
+                    headers['If-None-Match'] = meta['etag']
+                if meta.get('last_modified'):
+                    headers['If-Modified-Since'] = meta['last_modified']
+        except (OSError, ValueError):
+            pass
+
+        response = self.session.get(url, timeout=timeout, headers=headers)
+        if response.status_code == 304 and headers:
+            try:
+                with open(body_path, 'rb') as f:
+                    return f.read()
+            except OSError:
+                # Cached body disappeared; fetch it again unconditionally
+                response = self.session.get(url, timeout=timeout)
+
+        response.raise_for_status()
+        self._store(response, meta_path, body_path)
+        return response.content
+
+    def _store(self, response: requests.Response, meta_path: str, body_path: str) -> None:
+        """Cache a response body if the server sent validators for it"""
+        meta = {
+            'etag': response.headers.get('ETag'),
+            'last_modified': response.headers.get('Last-Modified'),
+        }
+        if not (meta['etag'] or meta['last_modified']):
+            return
+
+        # The cache is best effort; a failed write only costs a full download next time
+        try:
+            os.makedirs(self.cache_dir, exist_ok=True)
+            FileUtils.write_atomic(body_path, response.content)
+            FileUtils.write_atomic(meta_path, json.dumps(meta).encode('utf-8'))
+        except OSError:
+            pass
+
+
 class FileUtils:
     """File utility functions"""
     
@@ -593,6 +670,18 @@ class FileUtils:
         except Exception as e:
             raise Exception(f"Error saving file: {str(e)}")
     
+    @staticmethod
+    def write_atomic(file_path: str, content: bytes) -> None:
+        """Write bytes to a file via a temporary file so readers never see a partial write"""
+        fd, temp_path = tempfile.mkstemp(dir=os.path.dirname(file_path) or '.', suffix='.tmp')
+        try:
+            with os.fdopen(fd, 'wb') as f:
+                f.write(content)
+            os.replace(temp_path, file_path)
+        except BaseException:
+            os.unlink(temp_path)
+            raise
+
     @staticmethod
     def ensure_json_extension(filename: str) -> str:
         """Ensure filename has .json extension"""
@@ -603,6 +692,36 @@ class FileUtils:
 
 class TemplateUtils:
     """Template processing utilities"""
+
+    # Fields whose values repeat heavily across sources and architectures
+    INTERNED_FIELDS = ('title', 'image', 'platform', 'restart_policy')
+
+    @staticmethod
+    def intern_template_strings(templates: Any) -> None:
+        """Intern frequently repeated template strings in place"""
+        if not isinstance(templates, list):
+            return
+
+        for template in templates:
+            if not isinstance(template, dict):
+                continue
+
+            for field in TemplateUtils.INTERNED_FIELDS:
+                value = template.get(field)
+                if isinstance(value, str):
+                    template[field] = sys.intern(value)
+
+            categories = template.get('categories')
+            if isinstance(categories, list):
+                for i, category in enumerate(categories):
+                    if isinstance(category, str):
+                        categories[i] = sys.intern(category)
+
+            env_vars = template.get('env')
+            if isinstance(env_vars, list):
+                for var in env_vars:
+                    if isinstance(var, dict) and isinstance(var.get('name'), str):
+                        var['name'] = sys.intern(var['name'])
     
     @staticmethod
     def normalize_template_title(title: str) -> str: